@@ -6,7 +6,13 @@ import argparse
 import json
 
 from src.apis import APIConfigError
-from src.agents import AgentAPIError, ParadoxDetector, format_report
+from src.cache import SemanticReportCache
+from src.agents import (
+    DEFAULT_MAX_CONCURRENCY,
+    AgentAPIError,
+    ParadoxDetector,
+    format_report,
+)
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -36,6 +42,31 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print structured JSON report instead of formatted text.",
     )
+    parser.add_argument(
+        "--file",
+        default=None,
+        help=(
+            "Analyze every non-empty line of this file as a separate statement, "
+            "running them concurrently."
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=(
+            "Maximum statements analyzed at once with --file. "
+            f"Default: {DEFAULT_MAX_CONCURRENCY}"
+        ),
+    )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help=(
+            "Reuse the report of a near-identical statement analyzed earlier "
+            "in this run (most useful with --file)."
+        ),
+    )
     return parser
 
 
@@ -45,28 +76,70 @@ def _read_statement(parts: list[str]) -> str:
     return input("Please enter the viewpoint or proposal to be examined.: ").strip()
 
 
+def _read_statements_file(path: str) -> list[str]:
+    with open(path, encoding="utf-8") as handle:
+        return [line.strip() for line in handle if line.strip()]
+
+
 def main() -> int:
     parser = _build_parser()
     args = parser.parse_args()
-    statement = _read_statement(args.statement)
-    if not statement:
-        parser.error("Input statement cannot be empty.")
+    statements: list[str] = []
+    if args.file:
+        try:
+            statements = _read_statements_file(args.file)
+        except OSError as exc:
+            parser.error(f"Cannot read statements file: {exc}")
+        if not statements:
+            parser.error("Input statement cannot be empty.")
 
     try:
         detector = ParadoxDetector.from_default(
             output_language=args.lang,
             model_config=args.config,
+            report_cache=SemanticReportCache() if args.semantic_cache else None,
         )
-        report = detector.analyze(statement)
     except (APIConfigError, AgentAPIError, ValueError) as exc:
         print(f"[ERROR] {exc}")
         return 1
 
+    with detector:
+        if not args.file:
+            if not args.statement:
+                # Open the API connection while the user is still typing.
+                detector.client.warmup(background=True)
+            statements = [_read_statement(args.statement)]
+            if not statements[0]:
+                parser.error("Input statement cannot be empty.")
+
+        try:
+            if args.file:
+                reports = detector.analyze_many(
+                    statements, max_concurrency=args.concurrency
+                )
+            else:
+                reports = [detector.analyze(statements[0])]
+        except (APIConfigError, AgentAPIError, ValueError) as exc:
+            print(f"[ERROR] {exc}")
+            return 1
+
+    # With --file, a failed statement comes back as its exception.
+    failed = [isinstance(report, Exception) for report in reports]
     if args.json:
-        print(json.dumps(report, ensure_ascii=False, indent=2))
+        entries = [
+            {"statement": statement, "error": str(report)} if is_failed else report
+            for statement, report, is_failed in zip(statements, reports, failed)
+        ]
+        payload = entries if args.file else entries[0]
+        print(json.dumps(payload, ensure_ascii=False, indent=2))
     else:
-        print(format_report(report))
-    return 0
+        print(
+            "\n\n".join(
+                f"[ERROR] {statement}: {report}" if is_failed else format_report(report)
+                for statement, report, is_failed in zip(statements, reports, failed)
+            )
+        )
+    return 1 if any(failed) else 0
 
 
 if __name__ == "__main__":
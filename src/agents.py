@@ -2,24 +2,72 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timezone
+import email.utils
+import functools
 import hashlib
+import http.client
+import io
 import json
-from typing import Any
-from urllib import error as urlerror
-from urllib import request
+import logging
+import random
+import sqlite3
+import ssl
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 try:
     from src.prompts import *
     from src.apis import (
+        APIConfigError,
         ModelAPIConfig,
         load_model_config,
     )
+    from src.cache import (
+        DEFAULT_SQLITE_CACHE_PATH,
+        MemoryResponseCache,
+        ResponseCache,
+        SemanticReportCache,
+        SQLiteResponseCache,
+        response_cache_key,
+    )
+    from src.transport import HTTPConnectionPool
 except ModuleNotFoundError:
     from prompts import *
     from apis import (
+        APIConfigError,
         ModelAPIConfig,
         load_model_config,
     )
+    from cache import (
+        DEFAULT_SQLITE_CACHE_PATH,
+        MemoryResponseCache,
+        ResponseCache,
+        SemanticReportCache,
+        SQLiteResponseCache,
+        response_cache_key,
+    )
+    from transport import HTTPConnectionPool
+
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_MAX_DELAY_SECONDS = 30.0
+# Not retried: a timeout may fire after the server started generating, so a
+# resend re-pays the whole completion and stretches the wait to a multiple of
+# timeout_seconds; certificate failures and malformed endpoint URLs (ValueError)
+# will not fix themselves.
+NON_RETRYABLE_ERRORS = (TimeoutError, ssl.SSLCertVerificationError, ValueError)
+
+logger = logging.getLogger(__name__)
 
 
 class AgentAPIError(RuntimeError):
@@ -29,8 +77,24 @@ class AgentAPIError(RuntimeError):
 class OpenAICompatClient:
     """Minimal OpenAI-compatible client loaded from YAML model config."""
 
+    __slots__ = ("config", "_pool", "_cache")
+
     def __init__(self, config: ModelAPIConfig) -> None:
         self.config = config
+        self._pool = HTTPConnectionPool()
+        self._cache = _build_response_cache(config)
+
+    def __enter__(self) -> "OpenAICompatClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled connections and the response cache."""
+        self._pool.close()
+        if self._cache is not None:
+            self._cache.close()
 
     def chat(
         self,
@@ -38,86 +102,396 @@ class OpenAICompatClient:
         system_prompt: str,
         user_prompt: str,
         temperature: float | None = None,
+        max_tokens: int | None = None,
     ) -> str:
         if not self.config.api_key:
             raise AgentAPIError("API key is empty in loaded model config.")
 
-        resolved_temperature = (
-            self.config.default_temperature if temperature is None else temperature
+        resolved_temperature = self._resolve_temperature(temperature)
+        cache_key = self._cache_key(
+            system_prompt, user_prompt, resolved_temperature, max_tokens
+        )
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        body = self._request_body(
+            system_prompt, user_prompt, resolved_temperature, max_tokens
+        )
+        headers = self._request_headers()
+        attempt = 0
+        while True:
+            try:
+                resp = self._pool.request(
+                    "POST",
+                    self.config.endpoint,
+                    body=body,
+                    headers=headers,
+                    timeout=self.config.timeout_seconds,
+                )
+            except (OSError, http.client.HTTPException, ValueError) as exc:
+                delay = self._retry_delay(attempt, exc=exc)
+                if delay is None:
+                    raise AgentAPIError(
+                        f"{self.config.provider} request failed: {exc}"
+                    ) from exc
+            else:
+                delay = self._retry_delay(attempt, resp.status, resp.headers)
+                if delay is None:
+                    break
+            time.sleep(delay)
+            attempt += 1
+
+        raw = resp.body.decode("utf-8", errors="ignore")
+        if resp.status >= 400:
+            raise AgentAPIError(
+                f"{self.config.provider} request failed with HTTP {resp.status}: {raw}"
+            )
+
+        try:
+            data = _loads(raw)
+            content = data["choices"][0]["message"]["content"].strip()
+        except (KeyError, IndexError, TypeError, json.JSONDecodeError) as exc:
+            raise AgentAPIError(
+                f"{self.config.provider} response is not in expected format: {raw}"
+            ) from exc
+        self._log_usage(data.get("usage"))
+
+        if self._cache is not None:
+            self._cache.set(cache_key, content, self.config.cache_ttl_seconds)
+        return content
+
+    def chat_stream(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """Yield answer text chunks as the server streams them over SSE."""
+        if not self.config.api_key:
+            raise AgentAPIError("API key is empty in loaded model config.")
+
+        resolved_temperature = self._resolve_temperature(temperature)
+        cache_key = self._cache_key(
+            system_prompt, user_prompt, resolved_temperature, max_tokens
+        )
+        if self._cache is not None:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
+
+        body = self._request_body(
+            system_prompt, user_prompt, resolved_temperature, max_tokens, stream=True
+        )
+        headers = self._request_headers()
+        headers["Accept"] = "text/event-stream"
+        chunks: list[str] = []
+        attempt = 0
+        while True:
+            delay: float | None = None
+            try:
+                with self._pool.stream(
+                    "POST",
+                    self.config.endpoint,
+                    body=body,
+                    headers=headers,
+                    timeout=self.config.timeout_seconds,
+                ) as resp:
+                    if resp.status >= 400:
+                        detail = resp.read().decode("utf-8", errors="ignore")
+                        delay = self._retry_delay(attempt, resp.status, resp.headers)
+                        if delay is None:
+                            raise AgentAPIError(
+                                f"{self.config.provider} request failed with HTTP "
+                                f"{resp.status}: {detail}"
+                            )
+                    else:
+                        for raw_line in resp:
+                            line = raw_line.decode("utf-8", errors="ignore").strip()
+                            if not line.startswith("data:"):
+                                continue
+                            event = line[len("data:") :].strip()
+                            if event == "[DONE]":
+                                resp.read()
+                                break
+                            chunk = self._stream_delta(event)
+                            if chunk:
+                                chunks.append(chunk)
+                                yield chunk
+                        else:
+                            # http.client ends iteration quietly when the socket
+                            # closes mid-body; without [DONE] the answer is cut.
+                            raise http.client.HTTPException(
+                                "stream ended before [DONE]"
+                            )
+            except (OSError, http.client.HTTPException, ValueError) as exc:
+                # Once text has been yielded a retry would duplicate it.
+                delay = None if chunks else self._retry_delay(attempt, exc=exc)
+                if delay is None:
+                    raise AgentAPIError(
+                        f"{self.config.provider} request failed: {exc}"
+                    ) from exc
+            if delay is None:
+                break
+            time.sleep(delay)
+            attempt += 1
+
+        if self._cache is not None and chunks:
+            self._cache.set(
+                cache_key, "".join(chunks).strip(), self.config.cache_ttl_seconds
+            )
+
+    def warmup(self, *, background: bool = False) -> None:
+        """Best-effort: pre-open a pooled connection to the model endpoint."""
+        if background:
+            threading.Thread(target=self.warmup, daemon=True).start()
+            return
+        try:
+            self._pool.warmup(self.config.endpoint, timeout=self.config.timeout_seconds)
+        except (OSError, http.client.HTTPException, ValueError) as exc:
+            # The real request reports connection problems; nothing to do here.
+            logger.debug("%s warmup failed: %s", self.config.provider, exc)
+
+    async def achat(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Async variant of `chat`; the blocking request runs in a worker thread."""
+        return await asyncio.to_thread(
+            self.chat,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    def _retry_delay(
+        self,
+        attempt: int,
+        status: int | None = None,
+        headers: http.client.HTTPMessage | None = None,
+        *,
+        exc: BaseException | None = None,
+    ) -> float | None:
+        """Seconds to wait before retrying, or None if the outcome is final."""
+        if attempt >= self.config.max_retries or isinstance(
+            exc, NON_RETRYABLE_ERRORS
+        ):
+            return None
+        if exc is None and status not in RETRYABLE_STATUS_CODES:
+            return None
+
+        retry_after = (
+            _parse_retry_after(headers.get("Retry-After")) if headers else None
+        )
+        if retry_after is not None:
+            return min(retry_after, RETRY_MAX_DELAY_SECONDS)
+        base = self.config.retry_base_delay
+        return min(RETRY_MAX_DELAY_SECONDS, base * 2**attempt) + random.uniform(0, base)
+
+    def _resolve_temperature(self, temperature: float | None) -> float:
+        return self.config.default_temperature if temperature is None else temperature
+
+    def _cache_key(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> str:
+        if self._cache is None:
+            return ""
+        return response_cache_key(
+            model=self.config.model,
+            temperature=temperature,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            max_tokens=max_tokens,
         )
-        payload = {
+
+    def _request_body(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: int | None,
+        *,
+        stream: bool = False,
+    ) -> bytes:
+        payload: dict[str, Any] = {
             "model": self.config.model,
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": user_prompt},
             ],
-            "temperature": resolved_temperature,
+            "temperature": temperature,
         }
-        body = json.dumps(payload).encode("utf-8")
+        if max_tokens is not None:
+            payload["max_tokens"] = max_tokens
+        if stream:
+            payload["stream"] = True
+        return _dumps_bytes(payload)
+
+    def _request_headers(self) -> dict[str, str]:
         headers = dict(self.config.headers or {})
         headers["Authorization"] = f"Bearer {self.config.api_key}"
-        req = request.Request(
-            url=self.config.endpoint,
-            data=body,
-            headers=headers,
-            method="POST",
+        return headers
+
+    def _log_usage(self, usage: Any) -> None:
+        if not isinstance(usage, dict) or not logger.isEnabledFor(logging.DEBUG):
+            return
+        details = usage.get("prompt_tokens_details")
+        cached_tokens = (
+            usage.get("prompt_cache_hit_tokens")  # DeepSeek
+            or usage.get("cache_read_input_tokens")  # Anthropic
+            or (details.get("cached_tokens") if isinstance(details, dict) else None)
+            or 0
+        )
+        logger.debug(
+            "%s usage: prompt=%s cached_prompt=%s completion=%s tokens",
+            self.config.provider,
+            usage.get("prompt_tokens", usage.get("input_tokens")),
+            cached_tokens,
+            usage.get("completion_tokens", usage.get("output_tokens")),
         )
 
+    def _stream_delta(self, event: str) -> str:
         try:
-            with request.urlopen(req, timeout=self.config.timeout_seconds) as resp:
-                raw = resp.read().decode("utf-8")
-        except urlerror.HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="ignore")
+            data = _loads(event)
+            choices = data["choices"]
+            if not choices:
+                return ""
+            return choices[0].get("delta", {}).get("content") or ""
+        except (KeyError, TypeError, AttributeError, json.JSONDecodeError) as exc:
             raise AgentAPIError(
-                f"{self.config.provider} request failed with HTTP {exc.code}: {detail}"
+                f"{self.config.provider} stream event is not in expected format: "
+                f"{event}"
             ) from exc
-        except urlerror.URLError as exc:
-            raise AgentAPIError(f"{self.config.provider} request failed: {exc}") from exc
 
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def _dumps_bytes(value: Any) -> bytes:
+    """Compact UTF-8 JSON; uses orjson when installed."""
+    if orjson is not None:
         try:
-            data = json.loads(raw)
-            return data["choices"][0]["message"]["content"].strip()
-        except (KeyError, IndexError, TypeError, json.JSONDecodeError) as exc:
-            raise AgentAPIError(
-                f"{self.config.provider} response is not in expected format: {raw}"
-            ) from exc
+            return orjson.dumps(value)
+        except (orjson.JSONEncodeError, TypeError):  # e.g. ints beyond 64 bits
+            pass
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching the stdlib exception.
+_loads: Callable[[str | bytes], Any] = (
+    orjson.loads if orjson is not None else json.loads
+)
+
+
+def _build_response_cache(config: ModelAPIConfig) -> ResponseCache | None:
+    if not config.cache_enabled or config.cache_ttl_seconds <= 0:
+        return None
+    if config.cache_backend == "sqlite":
+        path = config.cache_path or DEFAULT_SQLITE_CACHE_PATH
+        try:
+            return SQLiteResponseCache(path)
+        except (OSError, sqlite3.Error) as exc:
+            raise APIConfigError(f"Cannot open response cache {path}: {exc}") from exc
+    return MemoryResponseCache()
+
+
+def _loads_dict_or_none(text: str) -> dict[str, Any] | None:
+    if not text or text[0] != "{" or text[-1] != "}":
+        return None
+    try:
+        parsed = _loads(text)
+    except json.JSONDecodeError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
 
 
 def _extract_json_dict(text: str) -> dict[str, Any]:
     """Parse the first JSON object from model output."""
-    cleaned = text.strip().replace("```json", "```")
-    if cleaned.startswith("```"):
-        cleaned = cleaned.strip("`").strip()
+    # Common case: the model followed "JSON only" and returned a bare object.
+    parsed = _loads_dict_or_none(text)
+    if parsed is not None:
+        return parsed
 
-    try:
-        parsed = json.loads(cleaned)
-        if isinstance(parsed, dict):
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = (
+            cleaned.removeprefix("```json")
+            .removeprefix("```")
+            .removesuffix("```")
+            .strip()
+        )
+        parsed = _loads_dict_or_none(cleaned)
+        if parsed is not None:
             return parsed
-    except json.JSONDecodeError:
-        pass
 
+    # raw_decode runs the C scanner from each "{" and stops at the end of the
+    # first complete object, so trailing prose never has to be rescanned.
+    decoder = json.JSONDecoder()
     start = cleaned.find("{")
     while start != -1:
-        depth = 0
-        for idx in range(start, len(cleaned)):
-            ch = cleaned[idx]
-            if ch == "{":
-                depth += 1
-            elif ch == "}":
-                depth -= 1
-                if depth == 0:
-                    candidate = cleaned[start : idx + 1]
-                    try:
-                        parsed = json.loads(candidate)
-                        if isinstance(parsed, dict):
-                            return parsed
-                    except json.JSONDecodeError:
-                        break
-        start = cleaned.find("{", start + 1)
+        try:
+            parsed, _ = decoder.raw_decode(cleaned, start)
+        except json.JSONDecodeError:
+            start = cleaned.find("{", start + 1)
+            continue
+        return parsed
 
     raise ValueError(f"Could not parse JSON object from model output: {text}")
 
 
+def _prompt_json(value: Any) -> str:
+    """Compact JSON for embedding upstream results in prompts (fewer tokens)."""
+    # Always stdlib: these strings feed _report_id and the response cache key,
+    # and orjson formats floats and NaN differently ("1e20" vs "1e+20"), which
+    # would make both depend on whether the speedups extra is installed.
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=32)
+def _system_prompt(instructions: str, output_language: str) -> str:
+    """Per-phase system message, rendered once per (phase, language)."""
+    phase_rules = instructions.format_map({"output_language": output_language})
+    return f"{BASE_SYSTEM_PROMPT}\n\n{phase_rules}"
+
+
+def _report_id(*parts: str) -> str:
+    """Short report ID hashed incrementally over already-serialized parts."""
+    # 6-byte BLAKE2b digest: same 12 hex chars as before, cheaper than SHA-256.
+    digest = hashlib.blake2b(digest_size=6)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")  # keeps ("ab", "c") distinct from ("a", "bc")
+    return digest.hexdigest()
+
+
 def _as_string_list(value: Any) -> list[str]:
     if isinstance(value, list):
         return [str(v).strip() for v in value if str(v).strip()]
@@ -168,14 +542,27 @@ def _s1_internal_knowledge_items(s1_result: dict[str, Any]) -> list[str]:
 class ParadoxDetector:
     """Implements solution v0.1.0 structured prompt chaining."""
 
+    __slots__ = ("client", "output_language", "report_cache")
+
     def __init__(
         self,
         client: OpenAICompatClient,
         *,
         output_language: str = "Chinese",
+        report_cache: SemanticReportCache | None = None,
     ) -> None:
         self.client = client
         self.output_language = output_language
+        self.report_cache = report_cache
+
+    def __enter__(self) -> "ParadoxDetector":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.client.close()
 
     @classmethod
     def from_default(
@@ -183,94 +570,204 @@ class ParadoxDetector:
         *,
         output_language: str = "Chinese",
         model_config: str | None = None,
+        report_cache: SemanticReportCache | None = None,
     ) -> "ParadoxDetector":
         loaded_config = load_model_config(model_config)
         return cls(
             client=OpenAICompatClient(loaded_config),
             output_language=output_language,
+            report_cache=report_cache,
         )
 
     def analyze(self, user_input: str) -> dict[str, Any]:
-        s1_knowledge = self._run_s1_knowledge_retrieval(user_input)
-        phase_1 = self._run_phase_1(user_input, s1_knowledge)
-        phase_2 = self._run_phase_2(user_input, phase_1)
-        phase_3 = self._run_phase_3(user_input, phase_1, phase_2)
-        return self._build_report(
+        return asyncio.run(self.aanalyze(user_input))
+
+    def analyze_many(
+        self,
+        user_inputs: Iterable[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[dict[str, Any] | Exception]:
+        return asyncio.run(
+            self.aanalyze_many(user_inputs, max_concurrency=max_concurrency)
+        )
+
+    async def aanalyze(self, user_input: str) -> dict[str, Any]:
+        if self.report_cache is None:
+            return await self._analyze_uncached(user_input)
+
+        # Embedding may run a local model, so keep it off the event loop.
+        namespace = self._report_cache_namespace()
+        cached = await asyncio.to_thread(
+            self.report_cache.get, user_input, namespace=namespace
+        )
+        if cached is not None:
+            return cached
+        report = await self._analyze_uncached(user_input)
+        await asyncio.to_thread(
+            self.report_cache.set, user_input, report, namespace=namespace
+        )
+        return report
+
+    async def _analyze_uncached(self, user_input: str) -> dict[str, Any]:
+        # Every stage consumes the previous one's output, so a single statement
+        # is inherently sequential; concurrency comes from `aanalyze_many`.
+        # Upstream results are serialized once and threaded through as locals
+        # (not instance state) so concurrent analyses never share them.
+        s1_knowledge = await self._run_s1_knowledge_retrieval(user_input)
+        s1_knowledge_json = _prompt_json(s1_knowledge)
+        phase_1 = await self._run_phase_1(user_input, s1_knowledge_json)
+        phase_1_json = _prompt_json(phase_1)
+        if self.client.config.batch_phases:
+            phase_2, phase_3 = await self._run_phases_2_3(user_input, phase_1_json)
+            phase_2_json = _prompt_json(phase_2)
+        else:
+            phase_2 = await self._run_phase_2(user_input, phase_1_json)
+            phase_2_json = _prompt_json(phase_2)
+            phase_3 = await self._run_phase_3(user_input, phase_1_json, phase_2_json)
+        report_id = _report_id(
             user_input,
+            s1_knowledge_json,
+            phase_1_json,
+            phase_2_json,
+            _prompt_json(phase_3),
+        )
+        return self._build_report(
+            report_id,
             s1_knowledge,
             phase_1,
             phase_2,
             phase_3,
         )
 
-    def _run_s1_knowledge_retrieval(self, user_input: str) -> dict[str, Any]:
-        prompt = S1_KNOWLEDGE_TEMPLATE.format(
-            output_language=self.output_language,
-            user_input=user_input,
+    async def aanalyze_many(
+        self,
+        user_inputs: Iterable[str],
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[dict[str, Any] | Exception]:
+        """Run independent statements concurrently, preserving input order.
+
+        A statement that fails (API error, unparsable model output) yields
+        its exception in place of a report, so one bad line does not discard
+        the rest of the batch.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _analyze_one(user_input: str) -> dict[str, Any] | Exception:
+            async with semaphore:
+                try:
+                    return await self.aanalyze(user_input)
+                except (AgentAPIError, ValueError) as exc:
+                    return exc
+
+        return list(
+            await asyncio.gather(*(_analyze_one(text) for text in user_inputs))
+        )
+
+    async def _run_s1_knowledge_retrieval(self, user_input: str) -> dict[str, Any]:
+        prompt = S1_KNOWLEDGE_TEMPLATE.format_map({"user_input": user_input})
+        raw = await self.client.achat(
+            system_prompt=self._phase_system_prompt(S1_KNOWLEDGE_INSTRUCTIONS),
+            user_prompt=prompt,
+            max_tokens=self._phase_max_tokens("s1_knowledge"),
         )
-        raw = self.client.chat(system_prompt=BASE_SYSTEM_PROMPT, user_prompt=prompt)
         return _extract_json_dict(raw)
 
-    def _run_phase_1(
-        self, user_input: str, s1_knowledge_result: dict[str, Any]
+    async def _run_phase_1(
+        self, user_input: str, s1_knowledge_json: str
     ) -> dict[str, Any]:
-        prompt = PHASE_1_TEMPLATE.format(
-            output_language=self.output_language,
-            s1_knowledge_json=json.dumps(
-                s1_knowledge_result, ensure_ascii=False, indent=2
-            ),
-            user_input=user_input,
+        prompt = PHASE_1_TEMPLATE.format_map(
+            {
+                "s1_knowledge_json": s1_knowledge_json,
+                "user_input": user_input,
+            }
+        )
+        raw = await self.client.achat(
+            system_prompt=self._phase_system_prompt(PHASE_1_INSTRUCTIONS),
+            user_prompt=prompt,
+            max_tokens=self._phase_max_tokens("phase_1"),
         )
-        raw = self.client.chat(system_prompt=BASE_SYSTEM_PROMPT, user_prompt=prompt)
         return _extract_json_dict(raw)
 
-    def _run_phase_2(
-        self, user_input: str, phase_1_result: dict[str, Any]
+    async def _run_phase_2(
+        self, user_input: str, phase_1_json: str
     ) -> dict[str, Any]:
-        prompt = PHASE_2_TEMPLATE.format(
-            output_language=self.output_language,
-            phase_1_json=json.dumps(phase_1_result, ensure_ascii=False, indent=2),
-            user_input=user_input,
+        prompt = PHASE_2_TEMPLATE.format_map(
+            {
+                "phase_1_json": phase_1_json,
+                "user_input": user_input,
+            }
+        )
+        raw = await self.client.achat(
+            system_prompt=self._phase_system_prompt(PHASE_2_INSTRUCTIONS),
+            user_prompt=prompt,
+            max_tokens=self._phase_max_tokens("phase_2"),
         )
-        raw = self.client.chat(system_prompt=BASE_SYSTEM_PROMPT, user_prompt=prompt)
         return _extract_json_dict(raw)
 
-    def _run_phase_3(
+    async def _run_phase_3(
         self,
         user_input: str,
-        phase_1_result: dict[str, Any],
-        phase_2_result: dict[str, Any],
+        phase_1_json: str,
+        phase_2_json: str,
     ) -> dict[str, Any]:
-        prompt = PHASE_3_TEMPLATE.format(
-            output_language=self.output_language,
-            phase_1_json=json.dumps(phase_1_result, ensure_ascii=False, indent=2),
-            phase_2_json=json.dumps(phase_2_result, ensure_ascii=False, indent=2),
-            user_input=user_input,
+        prompt = PHASE_3_TEMPLATE.format_map(
+            {
+                "phase_1_json": phase_1_json,
+                "phase_2_json": phase_2_json,
+                "user_input": user_input,
+            }
+        )
+        raw = await self.client.achat(
+            system_prompt=self._phase_system_prompt(PHASE_3_INSTRUCTIONS),
+            user_prompt=prompt,
+            max_tokens=self._phase_max_tokens("phase_3"),
         )
-        raw = self.client.chat(system_prompt=BASE_SYSTEM_PROMPT, user_prompt=prompt)
         return _extract_json_dict(raw)
 
+    async def _run_phases_2_3(
+        self, user_input: str, phase_1_json: str
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Run Phase II and III in one call and split the merged result."""
+        prompt = PHASE_2_3_TEMPLATE.format_map(
+            {
+                "phase_1_json": phase_1_json,
+                "user_input": user_input,
+            }
+        )
+        raw = await self.client.achat(
+            system_prompt=self._phase_system_prompt(PHASE_2_3_INSTRUCTIONS),
+            user_prompt=prompt,
+            max_tokens=self._phase_max_tokens("phase_2_3"),
+        )
+        combined = _extract_json_dict(raw)
+        phase_2 = {"branches": combined.get("branches", [])}
+        phase_3 = {key: value for key, value in combined.items() if key != "branches"}
+        return phase_2, phase_3
+
+    def _report_cache_namespace(self) -> str:
+        config = self.client.config
+        return f"{config.model}|{self.output_language}|{config.batch_phases}"
+
+    def _phase_max_tokens(self, phase: str) -> int | None:
+        return (self.client.config.phase_max_tokens or {}).get(phase)
+
+    def _phase_system_prompt(self, instructions: str) -> str:
+        # Stable per detector: identical bytes on every call keep the
+        # provider's prompt-prefix cache warm.
+        return _system_prompt(instructions, self.output_language)
+
     def _build_report(
         self,
-        user_input: str,
+        report_id: str,
         s1_knowledge: dict[str, Any],
         phase_1: dict[str, Any],
         phase_2: dict[str, Any],
         phase_3: dict[str, Any],
     ) -> dict[str, Any]:
-        digest_src = json.dumps(
-            {
-                "user_input": user_input,
-                "s1_knowledge": s1_knowledge,
-                "phase_1": phase_1,
-                "phase_2": phase_2,
-                "phase_3": phase_3,
-            },
-            ensure_ascii=False,
-            sort_keys=True,
-        )
-        report_id = hashlib.sha256(digest_src.encode("utf-8")).hexdigest()[:12]
-
         branches_raw = phase_2.get("branches")
         branches: list[dict[str, str]] = []
         if isinstance(branches_raw, list):
@@ -316,91 +813,60 @@ class ParadoxDetector:
         }
 
 
+def _write_bullets(
+    write: Callable[[str], Any],
+    label: str | None,
+    items: list[str],
+    *,
+    indent: str = "  ",
+) -> None:
+    if label is not None:
+        write(f"- {label}:\n")
+    for item in items or ["N/A"]:
+        write(f"{indent}- {item}\n")
+
+
 def format_report(report: dict[str, Any]) -> str:
-    lines: list[str] = [f"REPORT ID: {report.get('report_id', 'N/A')}"]
+    buf = io.StringIO()
+    w = buf.write
+    w(f"REPORT ID: {report.get('report_id', 'N/A')}\n")
 
     logical = report.get("logical_breakdown", {})
-    lines.append("")
-    lines.append("1. LOGICAL BREAKDOWN")
-    lines.append(f"- Primary Goal: {logical.get('primary_goal', '')}")
-    lines.append(
-        f"- Core Variables: {', '.join(logical.get('core_variables', [])) or 'N/A'}"
+    w("\n1. LOGICAL BREAKDOWN\n")
+    w(f"- Primary Goal: {logical.get('primary_goal', '')}\n")
+    w(f"- Core Variables: {', '.join(logical.get('core_variables', [])) or 'N/A'}\n")
+    _write_bullets(
+        w,
+        "Retrieved Internal Knowledge (S1)",
+        logical.get("retrieved_internal_knowledge", []),
     )
+    _write_bullets(
+        w,
+        "Internal Knowledge Used (Phase I)",
+        logical.get("internal_knowledge_used", []),
+    )
+    _write_bullets(w, "Knowledge Gaps", logical.get("knowledge_gaps", []))
+    _write_bullets(w, "Hidden Assumptions", logical.get("hidden_assumptions", []))
+    _write_bullets(w, "Reality Gaps", logical.get("reality_gaps", []))
 
-    retrieved_knowledge = logical.get("retrieved_internal_knowledge", [])
-    lines.append("- Retrieved Internal Knowledge (S1):")
-    if retrieved_knowledge:
-        for item in retrieved_knowledge:
-            lines.append(f"  - {item}")
-    else:
-        lines.append("  - N/A")
-
-    used_knowledge = logical.get("internal_knowledge_used", [])
-    lines.append("- Internal Knowledge Used (Phase I):")
-    if used_knowledge:
-        for item in used_knowledge:
-            lines.append(f"  - {item}")
-    else:
-        lines.append("  - N/A")
-
-    knowledge_gaps = logical.get("knowledge_gaps", [])
-    lines.append("- Knowledge Gaps:")
-    if knowledge_gaps:
-        for item in knowledge_gaps:
-            lines.append(f"  - {item}")
-    else:
-        lines.append("  - N/A")
-
-    assumptions = logical.get("hidden_assumptions", [])
-    lines.append("- Hidden Assumptions:")
-    if assumptions:
-        for item in assumptions:
-            lines.append(f"  - {item}")
-    else:
-        lines.append("  - N/A")
-
-    reality_gaps = logical.get("reality_gaps", [])
-    lines.append("- Reality Gaps:")
-    if reality_gaps:
-        for item in reality_gaps:
-            lines.append(f"  - {item}")
-    else:
-        lines.append("  - N/A")
-
-    lines.append("")
-    lines.append("2. STRESS TEST RESULTS (Phase II)")
+    w("\n2. STRESS TEST RESULTS (Phase II)\n")
     branches = report.get("stress_test_results", [])
     if branches:
         for idx, branch in enumerate(branches, start=1):
-            name = branch.get("name", f"Branch {idx}")
-            result = branch.get("result", "N/A")
-            goal_impact = branch.get("goal_impact", "N/A")
-            lines.append(f"- Branch {idx}: {name}")
-            lines.append(f"  Result: {result}")
-            lines.append(f"  Goal Impact: {goal_impact}")
+            w(f"- Branch {idx}: {branch.get('name', f'Branch {idx}')}\n")
+            w(f"  Result: {branch.get('result', 'N/A')}\n")
+            w(f"  Goal Impact: {branch.get('goal_impact', 'N/A')}\n")
     else:
-        lines.append("- N/A")
+        w("- N/A\n")
 
     diagnosis = report.get("paradox_diagnosis", {})
-    lines.append("")
-    lines.append("3. PARADOX DIAGNOSIS (Phase III)")
-    lines.append(f"- Type: {diagnosis.get('type', 'None')}")
-    lines.append(f"- Reasoning: {diagnosis.get('reasoning', '') or 'N/A'}")
-    lines.append("- Contradiction Path:")
-    path = diagnosis.get("contradiction_path", [])
-    if path:
-        for step in path:
-            lines.append(f"  - {step}")
-    else:
-        lines.append("  - N/A")
-
-    lines.append("")
-    lines.append("4. SUGGESTED MITIGATION")
-    mitigations = report.get("suggested_mitigation", [])
-    if mitigations:
-        for item in mitigations:
-            lines.append(f"- {item}")
-    else:
-        lines.append("- N/A")
+    w("\n3. PARADOX DIAGNOSIS (Phase III)\n")
+    w(f"- Type: {diagnosis.get('type', 'None')}\n")
+    w(f"- Reasoning: {diagnosis.get('reasoning', '') or 'N/A'}\n")
+    _write_bullets(w, "Contradiction Path", diagnosis.get("contradiction_path", []))
+
+    w("\n4. SUGGESTED MITIGATION\n")
+    _write_bullets(w, None, report.get("suggested_mitigation", []), indent="")
 
-    return "\n".join(lines)
+    # Callers expect no trailing newline (same as the former "\n".join).
+    return buf.getvalue()[:-1]
@@ -3,21 +3,33 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 from pathlib import Path
 import os
 from typing import Any
 
+try:
+    import yaml  # type: ignore[import-untyped]
+
+    # libyaml's C loader is much faster than the pure-Python SafeLoader.
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:  # pragma: no cover - depends on local env
+    yaml = None
+    _YamlLoader = None
+
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 DEFAULT_MODELS_DIR = PROJECT_ROOT / "assets" / "models"
 DEFAULT_MODEL_CONFIG = "deepseek-chat.yaml"
+CACHE_BACKENDS = ("memory", "sqlite")
+PIPELINE_PHASES = ("s1_knowledge", "phase_1", "phase_2", "phase_3", "phase_2_3")
 
 
 class APIConfigError(RuntimeError):
     """Raised when model API YAML config cannot be loaded or validated."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelAPIConfig:
     provider: str
     model: str
@@ -27,32 +39,53 @@ class ModelAPIConfig:
     chat_completions_path: str = "/chat/completions"
     default_temperature: float = 0.2
     headers: dict[str, str] | None = None
+    cache_enabled: bool = True
+    cache_ttl_seconds: float = 1800.0
+    cache_backend: str = "memory"
+    cache_path: str | None = None
+    phase_max_tokens: dict[str, int] | None = None
+    batch_phases: bool = True
+    max_retries: int = 3
+    retry_base_delay: float = 0.5
 
     @property
     def endpoint(self) -> str:
         return f"{self.base_url.rstrip('/')}{self.chat_completions_path}"
 
 
-def _import_yaml_module() -> Any:
-    try:
-        import yaml  # type: ignore[import-untyped]
-    except Exception as exc:  # pragma: no cover - depends on local env
-        raise APIConfigError(
-            "PyYAML is required to load model configs. Install with: pip install pyyaml"
-        ) from exc
-    return yaml
+@functools.lru_cache(maxsize=16)
+def _parse_config_yaml(path_text: str, mtime_ns: int) -> Any:
+    # Keyed on mtime so an edited file is re-read; the env-dependent parts of
+    # load_model_config (API key lookup) stay outside the cache.
+    text = Path(path_text).read_text(encoding="utf-8")
+    return yaml.load(text, Loader=_YamlLoader) or {}
+
+
+CONFIG_SUFFIXES = (".yaml", ".yml")
 
 
 def list_model_configs(models_dir: Path | None = None) -> list[str]:
     base_dir = models_dir or DEFAULT_MODELS_DIR
-    if not base_dir.exists():
+    try:
+        mtime_ns = base_dir.stat().st_mtime_ns
+    except OSError:
         return []
-    names: list[str] = []
-    for path in sorted(base_dir.glob("*.yaml")):
-        names.append(path.name)
-    for path in sorted(base_dir.glob("*.yml")):
-        names.append(path.name)
-    return sorted(set(names))
+    return list(_scan_model_configs(str(base_dir), mtime_ns))
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_model_configs(dir_text: str, mtime_ns: int) -> tuple[str, ...]:
+    # A directory's mtime changes whenever entries are added, removed, or
+    # renamed, so the listing stays valid until the key changes.
+    return tuple(
+        sorted(
+            {
+                path.name
+                for path in Path(dir_text).glob("*.y*ml")
+                if path.suffix in CONFIG_SUFFIXES and path.is_file()
+            }
+        )
+    )
 
 
 def _resolve_config_path(
@@ -60,6 +93,7 @@ def _resolve_config_path(
     models_dir: Path | None = None,
 ) -> Path:
     base_dir = models_dir or DEFAULT_MODELS_DIR
+    configs = list_model_configs(base_dir)
 
     candidate = (config or "").strip() or os.getenv("PARADOX_MODEL_CONFIG", "").strip()
     if candidate:
@@ -68,22 +102,26 @@ def _resolve_config_path(
             return raw
 
         normalized = candidate
-        if not normalized.endswith((".yaml", ".yml")):
+        if not normalized.endswith(CONFIG_SUFFIXES):
             normalized = f"{normalized}.yaml"
         name_path = base_dir / normalized
-        if name_path.is_file():
+        # Plain names are answered from the cached listing; nested paths
+        # under base_dir still need their own stat.
+        if Path(normalized).name == normalized:
+            found = normalized in configs
+        else:
+            found = name_path.is_file()
+        if found:
             return name_path
 
         raise APIConfigError(
             f"Model config not found: {candidate}. "
-            f"Try one of: {', '.join(list_model_configs(base_dir)) or 'N/A'}"
+            f"Try one of: {', '.join(configs) or 'N/A'}"
         )
 
-    default_path = base_dir / DEFAULT_MODEL_CONFIG
-    if default_path.is_file():
-        return default_path
+    if DEFAULT_MODEL_CONFIG in configs:
+        return base_dir / DEFAULT_MODEL_CONFIG
 
-    configs = list_model_configs(base_dir)
     if not configs:
         raise APIConfigError(
             f"No model YAML found under {base_dir}. "
@@ -97,10 +135,13 @@ def load_model_config(
     models_dir: Path | None = None,
 ) -> ModelAPIConfig:
     path = _resolve_config_path(config=config, models_dir=models_dir)
-    yaml = _import_yaml_module()
+    if yaml is None:
+        raise APIConfigError(
+            "PyYAML is required to load model configs. Install with: pip install pyyaml"
+        )
 
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        data = _parse_config_yaml(str(path.resolve()), path.stat().st_mtime_ns)
     except Exception as exc:
         raise APIConfigError(f"Failed to read model config YAML: {path}") from exc
 
@@ -133,6 +174,51 @@ def load_model_config(
     timeout_seconds = float(data.get("timeout_seconds", 90))
     default_temperature = float(data.get("default_temperature", 0.2))
 
+    cache_enabled = bool(data.get("cache_enabled", True))
+    cache_ttl_seconds = float(data.get("cache_ttl_seconds", 1800))
+    cache_backend = str(data.get("cache_backend", "memory")).strip().lower()
+    if cache_backend not in CACHE_BACKENDS:
+        raise APIConfigError(
+            f"Invalid config {path}: cache_backend must be one of "
+            f"{', '.join(CACHE_BACKENDS)}."
+        )
+    cache_path = str(data.get("cache_path") or "").strip() or None
+
+    raw_phase_max_tokens = data.get("phase_max_tokens")
+    phase_max_tokens: dict[str, int] = {}
+    if raw_phase_max_tokens is not None and not isinstance(raw_phase_max_tokens, dict):
+        raise APIConfigError(
+            f"Invalid config {path}: phase_max_tokens must be a mapping."
+        )
+    for phase, limit in (raw_phase_max_tokens or {}).items():
+        phase_name = str(phase).strip()
+        if phase_name not in PIPELINE_PHASES:
+            raise APIConfigError(
+                f"Invalid config {path}: unknown phase in phase_max_tokens: "
+                f"{phase_name}. Expected one of: {', '.join(PIPELINE_PHASES)}."
+            )
+        if limit is None:
+            continue
+        try:
+            token_limit = int(limit)
+        except (TypeError, ValueError) as exc:
+            raise APIConfigError(
+                f"Invalid config {path}: phase_max_tokens.{phase_name} must be an int."
+            ) from exc
+        if token_limit <= 0:
+            raise APIConfigError(
+                f"Invalid config {path}: phase_max_tokens.{phase_name} must be positive."
+            )
+        phase_max_tokens[phase_name] = token_limit
+
+    batch_phases = bool(data.get("batch_phases", True))
+    max_retries = int(data.get("max_retries", 3))
+    retry_base_delay = float(data.get("retry_base_delay", 0.5))
+    if max_retries < 0 or retry_base_delay < 0:
+        raise APIConfigError(
+            f"Invalid config {path}: max_retries/retry_base_delay must be >= 0."
+        )
+
     raw_headers = data.get("headers")
     headers: dict[str, str] = {}
     if isinstance(raw_headers, dict):
@@ -153,5 +239,13 @@ def load_model_config(
         chat_completions_path=chat_path,
         default_temperature=default_temperature,
         headers=headers,
+        cache_enabled=cache_enabled,
+        cache_ttl_seconds=cache_ttl_seconds,
+        cache_backend=cache_backend,
+        cache_path=cache_path,
+        phase_max_tokens=phase_max_tokens,
+        batch_phases=batch_phases,
+        max_retries=max_retries,
+        retry_base_delay=retry_base_delay,
     )
 
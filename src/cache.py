@@ -0,0 +1,237 @@
+"""Response caches that let repeated LLM calls skip the network."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import copy
+import functools
+import hashlib
+import logging
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Protocol, Sequence
+
+
+DEFAULT_SQLITE_CACHE_PATH = Path("~/.paradox_machine_cache.db")
+# Higher than typical semantic-cache settings: statements that differ by one
+# word ("minimize" vs "maximize") can flip the verdict, so a false hit costs more
+# than a miss. Only applies to sentence-transformers embeddings.
+DEFAULT_SEMANTIC_THRESHOLD = 0.95
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[str], Sequence[float]]
+_SemanticEntry = tuple[str, str, tuple[float, ...] | None, dict[str, Any]]
+
+
+class ResponseCache(Protocol):
+    def get(self, key: str) -> str | None: ...
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None: ...
+
+    def close(self) -> None: ...
+
+
+def response_cache_key(
+    *,
+    model: str,
+    temperature: float,
+    system_prompt: str,
+    user_prompt: str,
+    max_tokens: int | None = None,
+) -> str:
+    raw = f"{model}|{temperature}|{max_tokens}|{system_prompt}|{user_prompt}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class MemoryResponseCache:
+    """Process-local exact-match cache with per-entry TTL."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expiry, value = entry
+            if time.monotonic() < expiry:
+                return value
+            del self._entries[key]
+            return None
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+
+    def close(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteResponseCache:
+    """Exact-match cache persisted in a local SQLite file, shared across runs."""
+
+    def __init__(self, path: str | Path = DEFAULT_SQLITE_CACHE_PATH) -> None:
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, expires_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+            # The file is shared across runs; drop what earlier runs left behind
+            # so it does not grow without bound.
+            self._conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            )
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            expires_at, value = row
+            if time.time() < expires_at:
+                return value
+            with self._conn:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, expires_at, value) "
+                "VALUES (?, ?, ?)",
+                (key, time.time() + ttl_seconds, value),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def normalize_statement(text: str) -> str:
+    """Casefold and collapse whitespace for exact matching.
+
+    Punctuation is kept: "x > 0" and "x < 0", or "-5ms" and "5ms", must not
+    collapse into the same statement.
+    """
+    return " ".join(text.casefold().split())
+
+
+def sentence_transformer_embedder(
+    model_name: str = DEFAULT_EMBEDDING_MODEL,
+) -> Embedder | None:
+    """Local sentence-transformers embedder, or None if it is unavailable.
+
+    Unavailable covers both a missing package and a model that cannot be
+    loaded (e.g. offline with nothing cached), which is logged.
+    """
+    try:
+        from sentence_transformers import SentenceTransformer  # type: ignore
+    except ImportError:
+        return None
+    try:
+        model = SentenceTransformer(model_name)
+    except Exception as exc:  # download, cache and weight-format errors vary
+        logger.warning(
+            "Could not load embedding model %s (%s); semantic cache falls back "
+            "to exact matching.",
+            model_name,
+            exc,
+        )
+        return None
+
+    def _embed(text: str) -> tuple[float, ...]:
+        return tuple(model.encode(text, normalize_embeddings=True).tolist())
+
+    return _embed
+
+
+class SemanticReportCache:
+    """Thread-safe report cache that matches statements by embedding similarity.
+
+    Lookups compare the cosine similarity of normalized embeddings against
+    `threshold`. Without an embedder (sentence-transformers not installed or
+    its model failed to load), only statements equal after
+    `normalize_statement` match: surface-level similarity cannot tell
+    "minimize" from "maximize", so it is not used as a fallback. Entries are
+    evicted least recently used.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = DEFAULT_SEMANTIC_THRESHOLD,
+        max_entries: int = 256,
+        embedder: Embedder | None = None,
+    ) -> None:
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1].")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._embedder = embedder
+        self._embedder_resolved = embedder is not None
+        self._embed = functools.lru_cache(maxsize=max_entries)(self._compute_embedding)
+        self._entries: OrderedDict[int, _SemanticEntry] = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._embedder_lock = threading.Lock()
+
+    def get(self, text: str, *, namespace: str = "") -> dict[str, Any] | None:
+        normalized = normalize_statement(text)
+        vector = self._embed(text)
+        best_id: int | None = None
+        best_score = self.threshold
+        with self._lock:
+            for entry_id, entry in self._entries.items():
+                entry_namespace, entry_normalized, entry_vector, _ = entry
+                if entry_namespace != namespace:
+                    continue
+                if vector is None or entry_vector is None:
+                    if entry_normalized == normalized:
+                        best_id = entry_id
+                        break
+                    continue
+                score = sum(a * b for a, b in zip(vector, entry_vector))
+                if score >= best_score:
+                    best_id, best_score = entry_id, score
+            if best_id is None:
+                return None
+            self._entries.move_to_end(best_id)
+            report = self._entries[best_id][3]
+        return copy.deepcopy(report)
+
+    def set(self, text: str, report: dict[str, Any], *, namespace: str = "") -> None:
+        entry = (
+            namespace,
+            normalize_statement(text),
+            self._embed(text),
+            copy.deepcopy(report),
+        )
+        with self._lock:
+            self._entries[self._next_id] = entry
+            self._next_id += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _compute_embedding(self, text: str) -> tuple[float, ...] | None:
+        with self._embedder_lock:
+            if not self._embedder_resolved:
+                # Resolved once, even on failure: never retry the load per lookup.
+                self._embedder_resolved = True
+                self._embedder = sentence_transformer_embedder()
+            embedder = self._embedder
+        return None if embedder is None else tuple(embedder(text))
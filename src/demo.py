@@ -86,6 +86,27 @@ def _ask_once(
     )
 
 
+def _stream_once(
+    *,
+    client: OpenAICompatClient,
+    system_prompt: str,
+    question: str,
+    temperature: float | None,
+    prefix: str = "",
+) -> None:
+    """Print the answer as it streams in, so the first tokens show up early."""
+    print(prefix, end="", flush=True)
+    try:
+        for chunk in client.chat_stream(
+            system_prompt=system_prompt,
+            user_prompt=question,
+            temperature=temperature,
+        ):
+            print(chunk, end="", flush=True)
+    finally:
+        print()
+
+
 def main() -> int:
     parser = _build_parser()
     args = parser.parse_args()
@@ -99,6 +120,10 @@ def main() -> int:
 
     system_prompt = args.system or _default_system_prompt(args.lang)
 
+    if args.interactive or not args.question:
+        # Open the API connection while the user is still typing.
+        client.warmup(background=True)
+
     if args.interactive:
         print(
             f"[INFO] Interactive mode on | provider={config.provider} "
@@ -111,21 +136,33 @@ def main() -> int:
             if question.lower() in {"/exit", "exit", "quit"}:
                 return 0
             try:
-                answer = _ask_once(
+                _stream_once(
                     client=client,
                     system_prompt=system_prompt,
                     question=question,
                     temperature=args.temperature,
+                    prefix="A> ",
                 )
             except AgentAPIError as exc:
                 print(f"[ERROR] {exc}")
-                continue
-            print(f"A> {answer}")
 
     question = _read_question(args.question)
     if not question:
         parser.error("Input question cannot be empty.")
 
+    if not args.json:
+        try:
+            _stream_once(
+                client=client,
+                system_prompt=system_prompt,
+                question=question,
+                temperature=args.temperature,
+            )
+        except AgentAPIError as exc:
+            print(f"[ERROR] {exc}")
+            return 1
+        return 0
+
     try:
         answer = _ask_once(
             client=client,
@@ -137,21 +174,18 @@ def main() -> int:
         print(f"[ERROR] {exc}")
         return 1
 
-    if args.json:
-        print(
-            json.dumps(
-                {
-                    "provider": config.provider,
-                    "model": config.model,
-                    "question": question,
-                    "answer": answer,
-                },
-                ensure_ascii=False,
-                indent=2,
-            )
+    print(
+        json.dumps(
+            {
+                "provider": config.provider,
+                "model": config.model,
+                "question": question,
+                "answer": answer,
+            },
+            ensure_ascii=False,
+            indent=2,
         )
-    else:
-        print(answer)
+    )
     return 0
 
 
@@ -8,57 +8,42 @@ Rules:
 """.strip()
 
 
-S1_KNOWLEDGE_TEMPLATE = """
-S1: Internal Knowledge Retrieval.
-
-Task:
-- Retrieve internal domain knowledge relevant to the user's statement.
-- Knowledge must come from your internal model knowledge base.
-- Focus on mechanisms, constraints, and known trade-offs that can affect validity.
-- Keep each item atomic and reusable for downstream logic analysis.
-
-Return this exact JSON schema:
-{{
-  "internal_knowledge": [
-    {{
-      "item": "string",
-      "relevance": "string",
-      "confidence": "high | medium | low"
-    }}
-  ],
-  "knowledge_gaps": ["string"]
-}}
+# Each phase is split into stable instructions, sent as part of the system
+# message, and a template holding only per-request data. Keeping the stable
+# text first and byte-identical lets providers reuse their prompt-prefix cache.
 
+S1_KNOWLEDGE_INSTRUCTIONS = """
+S1: Internal Knowledge Retrieval.
+- Retrieve domain knowledge from your internal knowledge base relevant to the
+  user's statement.
+- Focus on mechanisms, constraints, and known trade-offs that affect validity.
+- Keep each item atomic and reusable for downstream analysis.
+JSON schema:
+{{"internal_knowledge":[{{"item":"string","relevance":"string","confidence":"high|medium|low"}}],"knowledge_gaps":["string"]}}
 Output language: {output_language}
+""".strip()
 
+
+S1_KNOWLEDGE_TEMPLATE = """
 User statement:
 {user_input}
 """.strip()
 
 
-PHASE_1_TEMPLATE = """
+PHASE_1_INSTRUCTIONS = """
 Phase I: Premise Extraction & Axiomatization.
-
-Task:
-- First, read and trust the provided S1 internal knowledge retrieval.
-- Read the user's statement.
-- Identify the explicit goal.
-- Identify core variables.
-- Identify hidden assumptions needed for success.
-- Identify reality gaps between statement and known system behavior.
-- Explicitly state which S1 internal knowledge items are used.
-
-Return this exact JSON schema:
-{{
-  "stated_goal": "string",
-  "core_variables": ["string"],
-  "internal_knowledge_used": ["string"],
-  "hidden_assumptions": ["string"],
-  "reality_gaps": ["string"]
-}}
-
+- Trust the provided S1 knowledge retrieval.
+- From the user's statement, identify the explicit goal, core variables,
+  hidden assumptions needed for success, and reality gaps versus known
+  system behavior.
+- List which S1 knowledge items are used.
+JSON schema:
+{{"stated_goal":"string","core_variables":["string"],"internal_knowledge_used":["string"],"hidden_assumptions":["string"],"reality_gaps":["string"]}}
 Output language: {output_language}
+""".strip()
+
 
+PHASE_1_TEMPLATE = """
 S1 internal knowledge retrieval:
 {s1_knowledge_json}
 
@@ -67,28 +52,18 @@ User statement:
 """.strip()
 
 
-PHASE_2_TEMPLATE = """
+PHASE_2_INSTRUCTIONS = """
 Phase II: Multi-Dimensional Expansion (constrained Tree of Thoughts).
-
-Task:
-- Infer multiple different outcomes caused by the premise.
-- Keep each branch logically distinct.
+- Infer multiple logically distinct outcomes caused by the premise.
 - Focus on consequences and impact on the stated goal.
 - Every branch must include both `result` and `goal_impact`. Do not omit fields.
-
-Return this exact JSON schema:
-{{
-  "branches": [
-    {{
-      "name": "string",
-      "result": "string",
-      "goal_impact": "string"
-    }}
-  ]
-}}
-
+JSON schema:
+{{"branches":[{{"name":"string","result":"string","goal_impact":"string"}}]}}
 Output language: {output_language}
+""".strip()
 
+
+PHASE_2_TEMPLATE = """
 Phase I result:
 {phase_1_json}
 
@@ -97,25 +72,20 @@ User statement:
 """.strip()
 
 
-PHASE_3_TEMPLATE = """
+PHASE_3_INSTRUCTIONS = """
 Phase III: Contradiction Catching & Mitigation.
-
-Classify paradox type by protocol:
+Classify paradox type:
 - Antinomy: Goal X implies destruction of Goal X (self-contradiction).
 - Falsidical: Looks valid but depends on false hidden assumption.
 - Veridical: Counterintuitive but technically valid trade-off.
 - None: no paradox detected under tested branches.
-
-Return this exact JSON schema:
-{{
-  "paradox_type": "Antinomy | Falsidical | Veridical | None",
-  "reasoning": "string",
-  "contradiction_path": ["string"],
-  "mitigation": ["string"]
-}}
-
+JSON schema:
+{{"paradox_type":"Antinomy|Falsidical|Veridical|None","reasoning":"string","contradiction_path":["string"],"mitigation":["string"]}}
 Output language: {output_language}
+""".strip()
 
+
+PHASE_3_TEMPLATE = """
 Phase I result:
 {phase_1_json}
 
@@ -125,3 +95,25 @@ Phase II result:
 User statement:
 {user_input}
 """.strip()
+
+
+# Phases II and III in a single round-trip (ModelAPIConfig.batch_phases).
+PHASE_2_3_INSTRUCTIONS = """
+Phase II + III: Multi-Dimensional Expansion, then Contradiction Catching.
+Step 1 (Phase II, constrained Tree of Thoughts):
+- Infer multiple logically distinct outcomes caused by the premise.
+- Focus on consequences and impact on the stated goal.
+- Every branch must include both `result` and `goal_impact`. Do not omit fields.
+Step 2 (Phase III), judging the Step 1 branches against the stated goal.
+Classify paradox type:
+- Antinomy: Goal X implies destruction of Goal X (self-contradiction).
+- Falsidical: Looks valid but depends on false hidden assumption.
+- Veridical: Counterintuitive but technically valid trade-off.
+- None: no paradox detected under tested branches.
+JSON schema:
+{{"branches":[{{"name":"string","result":"string","goal_impact":"string"}}],"paradox_type":"Antinomy|Falsidical|Veridical|None","reasoning":"string","contradiction_path":["string"],"mitigation":["string"]}}
+Output language: {output_language}
+""".strip()
+
+
+PHASE_2_3_TEMPLATE = PHASE_2_TEMPLATE
@@ -0,0 +1,251 @@
+"""Keep-alive HTTP transport shared by model API calls."""
+
+from __future__ import annotations
+
+import base64
+from contextlib import contextmanager
+from dataclasses import dataclass
+import http.client
+import ssl
+import threading
+from typing import Iterator
+from urllib import request as urlrequest
+from urllib.parse import unquote, urlsplit
+
+
+DEFAULT_POOL_MAXSIZE = 16
+
+# Raised by a kept-alive socket the server already closed; safe to resend once.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_PoolKey = tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class HTTPResponse:
+    status: int
+    headers: http.client.HTTPMessage
+    body: bytes
+
+
+class HTTPConnectionPool:
+    """Thread-safe pool of persistent connections keyed by scheme/host/port.
+
+    Reusing a connection skips the TCP and TLS handshakes that a fresh
+    `urllib.request.urlopen` call pays on every request. Proxies from the
+    environment are honored the same way `urllib` does.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_POOL_MAXSIZE) -> None:
+        self.maxsize = maxsize
+        self._idle: dict[_PoolKey, list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._ssl_context = ssl.create_default_context()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float,
+    ) -> HTTPResponse:
+        key, conn, resp = self._send(method, url, body, headers, timeout)
+        try:
+            data = resp.read()
+        except BaseException:
+            conn.close()
+            raise
+        self._finish(key, conn, resp)
+        return HTTPResponse(status=resp.status, headers=resp.headers, body=data)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        *,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float,
+    ) -> Iterator[http.client.HTTPResponse]:
+        """Yield the raw response for incremental reads.
+
+        The connection returns to the pool only if the body was read to the
+        end; a stream abandoned midway is closed instead.
+        """
+        key, conn, resp = self._send(method, url, body, headers, timeout)
+        try:
+            yield resp
+        except BaseException:
+            conn.close()
+            raise
+        if resp.isclosed():
+            self._finish(key, conn, resp)
+        else:
+            conn.close()
+
+    def warmup(self, url: str, *, timeout: float) -> None:
+        """Open an idle connection to `url` ahead of the first request.
+
+        Does nothing if one is already pooled. The TCP (and TLS) handshake
+        then overlaps with whatever the caller does meanwhile.
+        """
+        parts = urlsplit(url)
+        key = _pool_key(parts.scheme, parts.hostname, parts.port)
+        with self._lock:
+            if self._idle.get(key):
+                return
+        conn = self._new_connection(key, timeout)
+        try:
+            conn.connect()
+        except BaseException:
+            conn.close()
+            raise
+        self._release(key, conn)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeout: float,
+    ) -> tuple[_PoolKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+        parts = urlsplit(url)
+        key = _pool_key(parts.scheme, parts.hostname, parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        while True:
+            conn, reused = self._acquire(key, timeout)
+            try:
+                conn.request(
+                    method,
+                    _request_target(conn, key, target),
+                    body=body,
+                    headers=headers or {},
+                )
+                return key, conn, conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+    def _finish(
+        self,
+        key: _PoolKey,
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+    ) -> None:
+        if resp.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+    def _acquire(
+        self, key: _PoolKey, timeout: float
+    ) -> tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            conns = self._idle.get(key)
+            conn = conns.pop() if conns else None
+        if conn is None:
+            return self._new_connection(key, timeout), False
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _release(self, key: _PoolKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            conns = self._idle.setdefault(key, [])
+            if not self._closed and len(conns) < self.maxsize:
+                conns.append(conn)
+                return
+        conn.close()
+
+    def _new_connection(
+        self, key: _PoolKey, timeout: float
+    ) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        proxy = _proxy_for(scheme, host)
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(
+                    host, port, timeout=timeout, context=self._ssl_context
+                )
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+
+        proxy_host, proxy_port, proxy_headers = proxy
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                proxy_host, proxy_port, timeout=timeout, context=self._ssl_context
+            )
+            conn.set_tunnel(host, port, headers=proxy_headers)
+            return conn
+        conn = _ProxiedHTTPConnection(proxy_host, proxy_port, timeout=timeout)
+        conn.proxy_headers = proxy_headers
+        return conn
+
+
+class _ProxiedHTTPConnection(http.client.HTTPConnection):
+    """Plain-HTTP connection to a forward proxy (absolute-URI requests)."""
+
+    proxy_headers: dict[str, str] = {}
+
+    def putrequest(self, method: str, url: str, *args, **kwargs) -> None:
+        super().putrequest(method, url, *args, **kwargs)
+        for name, value in self.proxy_headers.items():
+            self.putheader(name, value)
+
+
+def _pool_key(scheme: str, host: str | None, port: int | None) -> _PoolKey:
+    if scheme not in {"http", "https"} or not host:
+        raise ValueError(f"Unsupported URL for HTTP transport: {scheme}://{host}")
+    return scheme, host, port or (443 if scheme == "https" else 80)
+
+
+def _request_target(
+    conn: http.client.HTTPConnection, key: _PoolKey, target: str
+) -> str:
+    if isinstance(conn, _ProxiedHTTPConnection):
+        scheme, host, port = key
+        return f"{scheme}://{host}:{port}{target}"
+    return target
+
+
+def _proxy_for(scheme: str, host: str) -> tuple[str, int, dict[str, str]] | None:
+    proxy_url = urlrequest.getproxies().get(scheme)
+    if not proxy_url or urlrequest.proxy_bypass(host):
+        return None
+    if "://" not in proxy_url:
+        proxy_url = f"http://{proxy_url}"
+    proxy = urlsplit(proxy_url)
+    if not proxy.hostname:
+        return None
+
+    headers: dict[str, str] = {}
+    if proxy.username:
+        credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+        token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        headers["Proxy-Authorization"] = f"Basic {token}"
+    return proxy.hostname, proxy.port or 80, headers
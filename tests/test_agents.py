@@ -0,0 +1,218 @@
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+import http.client
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+import pytest
+
+from src import agents
+from src.agents import AgentAPIError, OpenAICompatClient, _parse_retry_after
+from src.apis import ModelAPIConfig
+
+
+STREAM_PIECES = ("Hel", "lo")
+
+
+class _ScriptedHandler(BaseHTTPRequestHandler):
+    """Fake chat-completions endpoint; each POST runs the next scripted action.
+
+    Actions: ("status", code, headers), "drop" (close without a response),
+    "slow" (outlive the client timeout), "stream_cut" (one SSE chunk, then
+    close). An empty script answers normally, streaming if requested.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            action = server.script.pop(0) if server.script else "ok"
+
+        if action == "drop":
+            self.close_connection = True
+        elif action == "slow":
+            time.sleep(1.0)
+            self.close_connection = True
+        elif action == "stream_cut":
+            self._start_stream()
+            self._write_event(STREAM_PIECES[0])
+            self.close_connection = True
+        elif action != "ok":
+            _, status, headers = action
+            body = b'{"error":"scripted"}'
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif payload.get("stream"):
+            self._start_stream()
+            for piece in STREAM_PIECES:
+                self._write_event(piece)
+            self._write_chunk(b"data: [DONE]\n\n")
+            self.wfile.write(b"0\r\n\r\n")
+        else:
+            body = json.dumps(
+                {"choices": [{"message": {"content": " answer "}}]}
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def _start_stream(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+    def _write_event(self, piece: str) -> None:
+        event = {"choices": [{"delta": {"content": piece}}]}
+        self._write_chunk(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _ScriptedHandler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.requests = 0
+    httpd.script = []
+    thread = threading.Thread(
+        target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    try:
+        yield httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture
+def client(server):
+    config = ModelAPIConfig(
+        provider="fake",
+        model="fake-model",
+        base_url=f"http://127.0.0.1:{server.server_port}",
+        api_key="test-key",
+        timeout_seconds=0.5,
+        cache_enabled=False,
+        max_retries=2,
+        retry_base_delay=0.0,
+    )
+    with OpenAICompatClient(config) as client:
+        yield client
+
+
+def _busy(retry_after: str = "0") -> tuple[str, int, dict[str, str]]:
+    return ("status", 503, {"Retry-After": retry_after})
+
+
+def _chat(client: OpenAICompatClient) -> str:
+    return client.chat(system_prompt="system", user_prompt="user")
+
+
+def test_chat_retries_transient_status_then_succeeds(server, client):
+    server.script = [_busy(), ("status", 429, {})]
+
+    assert _chat(client) == "answer"
+    assert server.requests == 3
+
+
+def test_chat_gives_up_after_max_retries(server, client):
+    server.script = [_busy(), _busy(), _busy()]
+
+    with pytest.raises(AgentAPIError, match="HTTP 503"):
+        _chat(client)
+    assert server.requests == 3
+
+
+def test_chat_does_not_retry_client_errors(server, client):
+    server.script = [("status", 400, {})]
+
+    with pytest.raises(AgentAPIError, match="HTTP 400"):
+        _chat(client)
+    assert server.requests == 1
+
+
+def test_chat_waits_for_retry_after(server, client, monkeypatch):
+    delays = []
+    monkeypatch.setattr(agents.time, "sleep", delays.append)
+    server.script = [_busy("1.5"), _busy("120")]
+
+    assert _chat(client) == "answer"
+    assert delays == [1.5, agents.RETRY_MAX_DELAY_SECONDS]
+
+
+def test_chat_retries_dropped_connection(server, client):
+    server.script = ["drop"]
+
+    assert _chat(client) == "answer"
+    assert server.requests == 2
+
+
+def test_chat_does_not_retry_timeouts(server, client):
+    server.script = ["slow"]
+
+    with pytest.raises(AgentAPIError) as excinfo:
+        _chat(client)
+    assert isinstance(excinfo.value.__cause__, TimeoutError)
+    assert server.requests == 1
+
+
+def test_stream_retries_before_first_chunk(server, client):
+    server.script = [_busy()]
+
+    chunks = list(client.chat_stream(system_prompt="system", user_prompt="user"))
+
+    assert chunks == list(STREAM_PIECES)
+    assert server.requests == 2
+
+
+def test_stream_is_not_retried_after_text_was_yielded(server, client):
+    server.script = ["stream_cut"]
+    chunks = []
+
+    with pytest.raises(AgentAPIError, match=r"\[DONE\]"):
+        for chunk in client.chat_stream(system_prompt="system", user_prompt="user"):
+            chunks.append(chunk)
+    assert chunks == [STREAM_PIECES[0]]
+    assert server.requests == 1
+
+
+def test_retry_delay_classification(client):
+    assert client._retry_delay(0, exc=TimeoutError()) is None
+    assert client._retry_delay(0, exc=ValueError("bad url")) is None
+    assert client._retry_delay(0, exc=ConnectionResetError()) == 0.0
+    assert client._retry_delay(0, 200) is None
+    assert client._retry_delay(2, 503) is None  # max_retries exhausted
+
+    headers = http.client.HTTPMessage()
+    headers["Retry-After"] = "7"
+    assert client._retry_delay(0, 503, headers) == 7.0
+
+
+def test_parse_retry_after():
+    assert _parse_retry_after(None) is None
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(" 2.5 ") == 2.5
+    assert _parse_retry_after("-3") == 0.0
+
+    future = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 55.0 < _parse_retry_after(format_datetime(future, usegmt=True)) <= 60.0
+    past = datetime.now(timezone.utc) - timedelta(seconds=60)
+    assert _parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
@@ -0,0 +1,184 @@
+import logging
+import sqlite3
+import sys
+import types
+
+import pytest
+
+from src import cache as cache_module
+from src.cache import (
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    SemanticReportCache,
+    normalize_statement,
+    response_cache_key,
+)
+
+
+KEY_ARGS = {
+    "model": "m",
+    "temperature": 0.2,
+    "system_prompt": "system",
+    "user_prompt": "user",
+    "max_tokens": None,
+}
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [
+        ("model", "other"),
+        ("temperature", 0.3),
+        ("system_prompt", "system2"),
+        ("user_prompt", "user2"),
+        ("max_tokens", 512),
+    ],
+)
+def test_response_cache_key_covers_every_field(field, value):
+    assert response_cache_key(**KEY_ARGS) == response_cache_key(**KEY_ARGS)
+    assert response_cache_key(**KEY_ARGS) != response_cache_key(
+        **{**KEY_ARGS, field: value}
+    )
+
+
+def test_memory_cache_hits_until_expiry():
+    cache = MemoryResponseCache()
+    cache.set("live", "value", 60)
+    cache.set("expired", "value", 0)
+
+    assert cache.get("live") == "value"
+    assert cache.get("expired") is None
+    assert cache.get("missing") is None
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.db"
+    first = SQLiteResponseCache(path)
+    first.set("key", "value", 60)
+    first.close()
+
+    second = SQLiteResponseCache(path)
+    try:
+        assert second.get("key") == "value"
+    finally:
+        second.close()
+
+
+def test_sqlite_cache_drops_expired_rows_on_open(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = SQLiteResponseCache(path)
+    cache.set("expired", "value", 0)
+    cache.set("live", "value", 60)
+    assert cache.get("expired") is None
+    cache.set("expired_unread", "value", 0)
+    cache.close()
+
+    SQLiteResponseCache(path).close()
+
+    with sqlite3.connect(path) as conn:
+        keys = {row[0] for row in conn.execute("SELECT key FROM responses")}
+    assert keys == {"live"}
+
+
+def _fixed_embedder(vectors):
+    return lambda text: vectors[text]
+
+
+@pytest.fixture
+def no_sentence_transformers(monkeypatch):
+    monkeypatch.setattr(cache_module, "sentence_transformer_embedder", lambda: None)
+
+
+def test_normalize_statement_keeps_punctuation_and_signs():
+    assert normalize_statement("  Keep X\t> 0 ") == "keep x > 0"
+    assert normalize_statement("Keep x > 0") != normalize_statement("Keep x < 0")
+    assert normalize_statement("-5ms") != normalize_statement("5ms")
+
+
+def test_semantic_cache_without_embedder_matches_normalized_text_only(
+    no_sentence_transformers,
+):
+    cache = SemanticReportCache()
+    cache.set("Keep x > 0 at all times.", {"report_id": "GT"})
+
+    assert cache.get("keep  X > 0 at all times.") == {"report_id": "GT"}
+    assert cache.get("Keep x < 0 at all times.") is None
+    assert cache.get("Keep x > 0 at all times") is None
+
+
+def test_semantic_cache_uses_similarity_threshold():
+    cache = SemanticReportCache(
+        threshold=0.9,
+        embedder=_fixed_embedder(
+            {
+                "stored": (1.0, 0.0),
+                "paraphrase": (0.95, 0.31),
+                "unrelated": (0.0, 1.0),
+            }
+        ),
+    )
+    cache.set("stored", {"report_id": "A"})
+
+    assert cache.get("paraphrase") == {"report_id": "A"}
+    assert cache.get("unrelated") is None
+
+
+def test_semantic_cache_normalized_match_does_not_skip_similarity():
+    # Equal after normalization, but the embedder says they differ.
+    cache = SemanticReportCache(
+        embedder=_fixed_embedder({"Keep x > 0": (1.0, 0.0), "keep x > 0": (0.0, 1.0)})
+    )
+    cache.set("Keep x > 0", {"report_id": "A"})
+
+    assert cache.get("keep x > 0") is None
+
+
+def test_semantic_cache_separates_namespaces_and_copies_reports(
+    no_sentence_transformers,
+):
+    cache = SemanticReportCache()
+    report = {"report_id": "A", "items": ["x"]}
+    cache.set("statement", report, namespace="model-a")
+    report["items"].append("mutated")
+
+    assert cache.get("statement", namespace="model-b") is None
+    hit = cache.get("statement", namespace="model-a")
+    assert hit == {"report_id": "A", "items": ["x"]}
+    hit["items"].append("mutated")
+    assert cache.get("statement", namespace="model-a")["items"] == ["x"]
+
+
+def test_semantic_cache_evicts_least_recently_used(no_sentence_transformers):
+    cache = SemanticReportCache(max_entries=2)
+    cache.set("a", {"report_id": "A"})
+    cache.set("b", {"report_id": "B"})
+    assert cache.get("a") is not None
+    cache.set("c", {"report_id": "C"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"report_id": "A"}
+    assert cache.get("c") == {"report_id": "C"}
+
+
+def test_semantic_cache_falls_back_once_when_model_fails_to_load(
+    monkeypatch, caplog
+):
+    loads = []
+
+    class _OfflineSentenceTransformer:
+        def __init__(self, model_name):
+            loads.append(model_name)
+            raise OSError("offline and no cached model")
+
+    fake_module = types.ModuleType("sentence_transformers")
+    fake_module.SentenceTransformer = _OfflineSentenceTransformer
+    monkeypatch.setitem(sys.modules, "sentence_transformers", fake_module)
+
+    cache = SemanticReportCache()
+    with caplog.at_level(logging.WARNING, logger=cache_module.__name__):
+        cache.set("statement", {"report_id": "A"})
+        assert cache.get("statement") == {"report_id": "A"}
+        assert cache.get("other statement") is None
+
+    assert len(loads) == 1
+    assert "Could not load embedding model" in caplog.text